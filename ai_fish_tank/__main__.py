@@ -1,18 +1,20 @@
 """"
 Fish tank. Bot controls entire board.
 """
+import asyncio
+import json
 import textwrap
 
 import openai
-import pickle
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import Any, List, Tuple, Dict
 import logging
 import random
+import sys
 
 import os
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from ai_fish_tank.env_loader import load_env
 
@@ -28,6 +30,8 @@ TANK_HEIGHT = 5
 class Fish:
     """Represents a fish in the fish tank with attributes such as name, position, species, and personality traits."""
 
+    __slots__ = ("name", "position", "species", "traits", "emoji", "goal")
+
     def __init__(self, name: str, position: Tuple[int, int], species: str, traits: str, emoji: str, goal: str) -> None:
         """
         Initializes a Fish object.
@@ -44,7 +48,8 @@ class Fish:
         self.position = position
         self.species = species
         self.traits = traits
-        self.emoji = emoji
+        # Interned so emoji equality and dict lookups can short-circuit on identity.
+        self.emoji = sys.intern(emoji)
         self.goal = goal
 
     def move(self, new_position: Tuple[int, int]) -> None:
@@ -63,6 +68,8 @@ class Fish:
 class FishTank:
     """Represents the fish tank environment with fish and plants."""
 
+    __slots__ = ("rounds", "fish_list", "plants_list", "tank_size", "story_so_far", "current_layout", "conversation", "_personae_cache", "_client")
+
     def __init__(self, fish_list: List[Fish]) -> None:
         """
         Initializes the FishTank object.
@@ -79,6 +86,9 @@ class FishTank:
         self.initialize_with_plants(["🌿", "🌱"])
         self.current_layout = []
         self.conversation = []
+        self._personae_cache = None
+        # One client for the life of the tank so the HTTP connection pool is reused.
+        self._client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
     def initialize_with_plants(self, plants: List[str]) -> None:
         """
@@ -90,13 +100,17 @@ class FishTank:
         # select a random position for each plant bound by tank size
         for plant in plants:
             x, y = random.randint(0, self.tank_size[0] - 1), random.randint(0, self.tank_size[1] - 1)
-            self.plants_list.append((plant, (x, y)))
+            self.plants_list.append((sys.intern(plant), (x, y)))
 
     def personae_dramatis_markdown(self):
         """
         Returns a markdown summary of the fish in the tank.
         """
-        return "\n".join([f"- {fish.emoji} {fish.name} ({fish.species}, {fish.traits})" for fish in self.fish_list])
+        # The cast never changes after construction, so build the summary once.
+        if self._personae_cache is None:
+            self._personae_cache = "\n".join(
+                ["- %s %s (%s, %s)" % (fish.emoji, fish.name, fish.species, fish.traits) for fish in self.fish_list])
+        return self._personae_cache
 
     def draw(self) -> str:
         """Visual representation of the fish tank as a 12x12 grid."""
@@ -115,7 +129,7 @@ class FishTank:
         self.current_layout = tank
         return "\n".join(["".join(row) for row in tank])
 
-    def list_differences(self, new_layout: List[List[str]]) -> Dict[str, Tuple[int, int]]:
+    def list_differences(self, new_layout: List[List[str]]) -> Dict[Tuple[int, int], Tuple[str, str]]:
         """
         Returns the differences between the current layout and the new layout.
 
@@ -123,14 +137,16 @@ class FishTank:
             new_layout (List[List[str]]): The new layout of the fish tank.
 
         Returns:
-            Dict[str, Tuple[int, int]]: A dictionary containing the differences between the two layouts.
+            Dict[Tuple[int, int], Tuple[str, str]]: Maps changed cells to their (old, new) emojis.
         """
         differences = {}
         for i in range(len(self.current_layout)):
+            # Most rows are unchanged between rounds; skip them wholesale.
+            if self.current_layout[i] == new_layout[i]:
+                continue
             for j in range(len(self.current_layout[i])):
                 if self.current_layout[i][j] != new_layout[i][j]:
-                    differences[self.current_layout[i][j] + new_layout[i][j]] = (
-                    self.current_layout[i][j], new_layout[i][j])
+                    differences[(i, j)] = (self.current_layout[i][j], new_layout[i][j])
         return differences
 
     def pretty_print_and_wrap(self, story: str) -> str:
@@ -179,16 +195,14 @@ class FishTank:
                     if cell == fish.emoji:
                         fish.move((i, j))
 
-    def generate_story(self) -> str:
+    async def generate_story(self) -> str:
         """
         Generates a story based on the current state of the fish tank using OpenAI API.
 
         Returns:
             str: The story generated by the OpenAI API.
         """
-        client = OpenAI(
-            api_key=os.environ.get("OPENAI_API_KEY"),
-        )
+        client = self._client
         self.rounds += 1
         if self.rounds == 1:
             prompt = "Here is the personae dramatis:\n" + self.personae_dramatis_markdown() + "\n"
@@ -211,7 +225,7 @@ class FishTank:
             ]
         else:
             self.conversation.append({"role": "user", "content": prompt})
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=self.conversation,
             max_tokens=5000
@@ -226,19 +240,66 @@ class FishTank:
         LOGGER.debug("Received story: %s", story)
         return story
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns a JSON-serializable snapshot of the tank."""
+        return {
+            "rounds": self.rounds,
+            "fish_list": [
+                {
+                    "name": fish.name,
+                    "position": fish.position,
+                    "species": fish.species,
+                    "traits": fish.traits,
+                    "emoji": fish.emoji,
+                    "goal": fish.goal,
+                }
+                for fish in self.fish_list
+            ],
+            "plants_list": self.plants_list,
+            "story_so_far": self.story_so_far,
+            "current_layout": self.current_layout,
+            "conversation": self.conversation,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "FishTank":
+        """Rebuilds a tank from a to_dict snapshot."""
+        fish_list = [
+            Fish(
+                name=item["name"],
+                position=tuple(item["position"]),
+                species=item["species"],
+                traits=item["traits"],
+                emoji=item["emoji"],
+                goal=item["goal"],
+            )
+            for item in data["fish_list"]
+        ]
+        tank = cls(fish_list=fish_list)
+        tank.rounds = data["rounds"]
+        tank.plants_list = [(plant, tuple(position)) for plant, position in data["plants_list"]]
+        tank.story_so_far = data["story_so_far"]
+        tank.current_layout = data["current_layout"]
+        tank.conversation = data["conversation"]
+        return tank
+
+    def snapshot_state(self) -> str:
+        """Serializes the tank to its JSON snapshot text."""
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
     def save_state(self, save_path) -> None:
-        """Saves the current state of the fish tank to a pickle file."""
+        """Saves the current state of the fish tank to a JSON file."""
         LOGGER.debug("Saving fish tank state to %s", save_path)
-        with open(save_path, 'wb') as file:
-            pickle.dump(self, file)
+        with open(save_path, 'w', encoding='utf-8') as file:
+            file.write(self.snapshot_state())
 
     @classmethod
     def load_state(cls, save_path:Path) -> "FishTank":
-        """Loads the fish tank state from a pickle file."""
+        """Loads the fish tank state from a JSON file."""
         if save_path.exists():
             LOGGER.debug("Loading fish tank state from %s", save_path)
-            with open(save_path, 'rb') as file:
-                return pickle.load(file)
+            with open(save_path, encoding='utf-8') as file:
+                return cls.from_dict(json.load(file))
         else:
             LOGGER.warning("No save file found at %s", save_path)
 
@@ -258,24 +319,36 @@ class FishTankSimulator:
         self.save_path = save_path
 
 
-    def run_simulation(self) -> None:
+    async def run_simulation(self) -> None:
         """Runs the fish tank simulation, updating the tank and generating stories."""
         print(self.fish_tank.personae_dramatis_markdown())
+        save_task = None
         while True:
             print("\nCurrent Fish Tank:")
             print(self.fish_tank.draw())
-            story = self.fish_tank.generate_story()
+            if save_task is None:
+                story = await self.fish_tank.generate_story()
+            else:
+                # Overlap the HTTPS round trip with the previous round's disk write.
+                story, _ = await asyncio.gather(self.fish_tank.generate_story(), save_task)
+                save_task = None
             print("\nStory:")
 
             # format story so it word wraps nicely
             print(self.fish_tank.pretty_print_and_wrap(story))
 
             self.fish_tank.update_tank(story)
-            self.fish_tank.save_state(self.save_path)
+            # Serialize here, while nothing else touches the tank; only the file
+            # write overlaps the next round, and it sees an immutable snapshot.
+            snapshot = self.fish_tank.snapshot_state()
+            save_task = asyncio.create_task(
+                asyncio.to_thread(self.save_path.write_text, snapshot, encoding="utf-8"))
 
             user_input = input("\nContinue simulation? (y/n): ").strip().lower()
             if user_input != 'y':
                 break
+        if save_task is not None:
+            await save_task
 
 
 if __name__ == "__main__":
@@ -299,11 +372,11 @@ if __name__ == "__main__":
     emojis = [fish.emoji for fish in fish_list]
     assert len(emojis) == len(set(emojis)), "Fish must have distinct emojis"
 
-    save_path = Path("fish_tank_state.pkl")
+    save_path = Path("fish_tank_state.json")
     if save_path.exists():
         fish_tank = FishTank.load_state(save_path)
     else:
         fish_tank = FishTank(fish_list=fish_list)
 
-    simulator = FishTankSimulator(fish_tank=fish_tank, save_path=Path("fish_tank_state.pkl"))
-    simulator.run_simulation()
+    simulator = FishTankSimulator(fish_tank=fish_tank, save_path=Path("fish_tank_state.json"))
+    asyncio.run(simulator.run_simulation())
@@ -1,13 +1,20 @@
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from typing import List, Set, Tuple, Optional
 import logging
+import sys
+import weakref
+
+import numpy as np
 
 # Setting up logging
 LOGGER = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Movement deltas keyed by compass direction; one dict lookup per move.
+_DELTAS = {"north": (0, -1), "south": (0, 1), "east": (1, 0), "west": (-1, 0)}
+
 
-@dataclass
+@dataclass(slots=True)
 class Fish:
     """Represents a fish in the fish tank."""
     name: str
@@ -18,44 +25,43 @@ class Fish:
 
     def update_field_of_view(self) -> None:
         """Updates the fish's field of view based on its current position in the tank."""
-        LOGGER.info(f"Updating field of view for fish {self.name} at position {self.position}")
+        LOGGER.debug("Updating field of view for fish %s at position %s", self.name, self.position)
         self.field_of_view = self.tank.get_mini_map(self.position)
 
     def move(self, direction: str) -> None:
         """Attempts to move the fish in the specified direction."""
-        LOGGER.info(f"Fish {self.name} attempting to move {direction} from position {self.position}")
+        LOGGER.info("Fish %s attempting to move %s from position %s", self.name, direction, self.position)
         new_position = self.calculate_new_position(direction)
         if self.tank.is_move_possible(new_position):
-            LOGGER.info(f"Move successful. {self.name} moved to {new_position}")
+            LOGGER.info("Move successful. %s moved to %s", self.name, new_position)
+            old_x, old_y = self.position
+            new_x, new_y = new_position
+            self.tank.occupancy[old_y, old_x] = "⬛"
+            self.tank.occupancy[new_y, new_x] = self.emoji
+            self.tank._mark_dirty(old_y, new_y)
             self.position = new_position
             self.update_field_of_view()
         else:
-            LOGGER.info(f"Move blocked. {self.name} remains at {self.position}")
+            LOGGER.info("Move blocked. %s remains at %s", self.name, self.position)
 
     def calculate_new_position(self, direction: str) -> Tuple[int, int]:
         """Calculates the new position based on the current position and the given direction."""
         x, y = self.position
-        if direction == "north":
-            return x, y - 1
-        elif direction == "south":
-            return x, y + 1
-        elif direction == "east":
-            return x + 1, y
-        elif direction == "west":
-            return x - 1, y
-        else:
-            LOGGER.warning(f"Invalid direction '{direction}' provided.")
+        delta = _DELTAS.get(direction)
+        if delta is None:
+            LOGGER.warning("Invalid direction '%s' provided.", direction)
             return self.position  # Return the same position if the direction is invalid
+        return x + delta[0], y + delta[1]
 
 
-@dataclass
+@dataclass(slots=True)
 class InanimateObject:
     """Represents an inanimate object in the fish tank."""
     emoji: str
     position: Tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class FishTank:
     """Represents the fish tank containing fish and inanimate objects."""
     width: int
@@ -65,89 +71,66 @@ class FishTank:
     top_border: str = "🌊"
     bottom_border: str = "🪨"
     side_border: str = "🪟"
+    occupancy: "np.ndarray" = field(init=False, repr=False, compare=False)
+    _rendered_rows: List[str] = field(init=False, repr=False, compare=False)
+    _dirty_rows: Set[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Builds the occupancy grid so lookups by position are O(1)."""
+        self.occupancy = np.full((self.height, self.width), "⬛", dtype=object)
+        # Rendered row cache; every row starts dirty so the first render draws all of them.
+        self._rendered_rows = [""] * self.height
+        self._dirty_rows = set(range(self.height))
+
+    def _mark_dirty(self, *ys: int) -> None:
+        """Flags rows that must be redrawn on the next render."""
+        self._dirty_rows.update(ys)
 
     def add_fish(self, fish: Fish) -> None:
         """Adds a fish to the tank."""
-        LOGGER.info(f"Adding fish {fish.name} at position {fish.position}")
+        LOGGER.info("Adding fish %s at position %s", fish.name, fish.position)
+        # Only the tank holds strong references; the back-reference is a weak
+        # proxy, so fish/tank pairs never form a cycle for the GC to chase.
+        fish.tank = weakref.proxy(self)
         self.fishes.append(fish)
+        x, y = fish.position
+        self.occupancy[y, x] = fish.emoji
+        self._mark_dirty(y)
 
     def add_object(self, obj: InanimateObject) -> None:
         """Adds an inanimate object to the tank."""
-        LOGGER.info(f"Adding object {obj.emoji} at position {obj.position}")
+        LOGGER.info("Adding object %s at position %s", obj.emoji, obj.position)
         self.objects.append(obj)
+        x, y = obj.position
+        self.occupancy[y, x] = obj.emoji
+        self._mark_dirty(y)
 
     def is_move_possible(self, position: Tuple[int, int]) -> bool:
         """Checks if a move is possible (within bounds and no collision with objects)."""
         x, y = position
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return False
-
-        for obj in self.objects:
-            if obj.position == position:
-                return False
-
-        for fish in self.fishes:
-            if fish.position == position:
-                return False
-
-        return True
+        return 0 <= x < self.width and 0 <= y < self.height and self.occupancy[y, x] == "⬛"
 
     def get_mini_map(self, position: Tuple[int, int], view_range: int = 2) -> List[List[Optional[str]]]:
         """Generates a mini-map of the surrounding area based on the fish's position."""
         x, y = position
-        mini_map = []
-        for dy in range(-view_range, view_range + 1):
-            row = []
-            for dx in range(-view_range, view_range + 1):
-                px, py = x + dx, y + dy
-                if 0 <= px < self.width and 0 <= py < self.height:
-                    found_object = None
-                    # Check for fish first
-                    for fish in self.fishes:
-                        if fish.position == (px, py):
-                            found_object = fish.emoji
-                            break
-                    # Check for objects
-                    if not found_object:
-                        for obj in self.objects:
-                            if obj.position == (px, py):
-                                found_object = obj.emoji
-                                break
-                    row.append(found_object if found_object else "⬛")
-                else:
-                    row.append(None)  # Out of bounds
-            mini_map.append(row)
-        LOGGER.info(f"Mini-map for fish at position {position} generated.")
+        # Pad with None so out-of-bounds cells fall out of the slice for free.
+        padded = np.pad(self.occupancy, view_range, constant_values=None)
+        mini_map = padded[y:y + 2 * view_range + 1, x:x + 2 * view_range + 1].tolist()
+        LOGGER.debug("Mini-map for fish at position %s generated.", position)
         return mini_map
 
     def render_tank(self) -> None:
         """Renders the entire fish tank with borders and objects."""
         LOGGER.info("Rendering fish tank with borders.")
 
-        # Render the top border
-        print(self.top_border * (self.width + 2))
-
-        for y in range(self.height):
-            row = [self.side_border]
-            for x in range(self.width):
-                # Check if there's a fish at the current position
-                emoji = "⬛"
-                for fish in self.fishes:
-                    if fish.position == (x, y):
-                        emoji = fish.emoji
-                        break
-                # Check if there's an object at the current position
-                if emoji == "⬛":
-                    for obj in self.objects:
-                        if obj.position == (x, y):
-                            emoji = obj.emoji
-                            break
-                row.append(emoji)
-            row.append(self.side_border)
-            print("".join(row))
-
-        # Render the bottom border
-        print(self.bottom_border * (self.width + 2))
+        # Rebuild only rows that changed since the last render.
+        for y in self._dirty_rows:
+            self._rendered_rows[y] = self.side_border + "".join(self.occupancy[y]) + self.side_border
+        self._dirty_rows.clear()
+
+        border = self.top_border * (self.width + 2)
+        bottom = self.bottom_border * (self.width + 2)
+        sys.stdout.write(border + "\n" + "\n".join(self._rendered_rows) + "\n" + bottom + "\n")
 
 
 if __name__ == "__main__":
@@ -1,13 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional
+from typing import Dict, List, Set, Tuple, Optional
 import logging
+import os
+import random
+import sys
 
 # Setting up logging
 LOGGER = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Movement deltas keyed by compass direction; one dict lookup per move.
+_DELTAS = {"north": (0, -1), "south": (0, 1), "east": (1, 0), "west": (-1, 0)}
 
-@dataclass
+
+@dataclass(slots=True)
 class Fish:
     """Represents a fish in the fish tank."""
     name: str
@@ -19,71 +26,74 @@ class Fish:
 
     def update_field_of_view(self) -> None:
         """Updates the fish's field of view based on its current position in the tank."""
-        LOGGER.info(f"Updating field of view for fish {self.name} at position {self.position}")
+        LOGGER.debug("Updating field of view for fish %s at position %s", self.name, self.position)
         self.field_of_view = self.tank.get_mini_map(self.position)
 
     def move(self, direction: str) -> None:
         """Attempts to move the fish in the specified direction."""
-        LOGGER.info(f"Fish {self.name} attempting to move {direction} from position {self.position}")
+        LOGGER.info("Fish %s attempting to move %s from position %s", self.name, direction, self.position)
         new_position = self.calculate_new_position(direction)
         if self.tank.is_move_possible(new_position):
-            LOGGER.info(f"Move successful. {self.name} moved to {new_position}")
+            LOGGER.info("Move successful. %s moved to %s", self.name, new_position)
+            self.tank._occupied.remove(self.position)
+            self.tank._occupied.add(new_position)
             self.position = new_position
             self.update_field_of_view()
         else:
-            LOGGER.info(f"Move blocked. {self.name} remains at {self.position}")
+            LOGGER.info("Move blocked. %s remains at %s", self.name, self.position)
 
     def calculate_new_position(self, direction: str) -> Tuple[int, int]:
         """Calculates the new position based on the current position and the given direction."""
         x, y = self.position
-        if direction == "north":
-            return x, y - 1
-        elif direction == "south":
-            return x, y + 1
-        elif direction == "east":
-            return x + 1, y
-        elif direction == "west":
-            return x - 1, y
-        else:
-            LOGGER.warning(f"Invalid direction '{direction}' provided.")
+        delta = _DELTAS.get(direction)
+        if delta is None:
+            LOGGER.warning("Invalid direction '%s' provided.", direction)
             return self.position  # Return the same position if the direction is invalid
+        return x + delta[0], y + delta[1]
+
+    def propose(self, direction: str) -> None:
+        """Records the move this fish wants to make; resolved later by the tank."""
+        target = self.calculate_new_position(direction)
+        if target == self.position:
+            return  # Invalid direction; nothing to request.
+        self.tank._requests.setdefault(target, []).append(self)
 
     def eat(self, direction: str) -> None:
         """Attempts to eat something in the specified direction."""
-        LOGGER.info(f"{self.name} is attempting to eat in the {direction} direction.")
+        LOGGER.info("%s is attempting to eat in the %s direction.", self.name, direction)
         target_position = self.calculate_new_position(direction)
         target = self.tank.get_object_at_position(target_position)
 
         if target and target in self.likes_to_eat:
-            LOGGER.info(f"{self.name} ate {target} at position {target_position}.")
+            LOGGER.info("%s ate %s at position %s.", self.name, target, target_position)
             self.tank.remove_object_at_position(target_position)
         else:
             LOGGER.info(
-                f"Nothing edible found at position {target_position} or {self.name} doesn't like to eat {target}.")
+                "Nothing edible found at position %s or %s doesn't like to eat %s.", target_position, self.name, target)
 
     def attack(self, direction: str) -> None:
         """Attempts to attack another fish in the specified direction."""
-        LOGGER.info(f"{self.name} is attempting to attack in the {direction} direction.")
+        LOGGER.info("%s is attempting to attack in the %s direction.", self.name, direction)
         target_position = self.calculate_new_position(direction)
         target_fish = self.tank.get_fish_at_position(target_position)
 
         if target_fish:
-            LOGGER.info(f"{self.name} attacked {target_fish.name} at position {target_position}!")
+            LOGGER.info("%s attacked %s at position %s!", self.name, target_fish.name, target_position)
             # Implement attack logic (e.g., reduce health or remove the fish)
             # For now, we can assume the fish is removed from the tank after attack
             self.tank.remove_fish_at_position(target_position)
         else:
-            LOGGER.info(f"No fish found to attack at position {target_position}.")
+            LOGGER.info("No fish found to attack at position %s.", target_position)
 
 
-@dataclass
+@dataclass(slots=True)
 class InanimateObject:
     """Represents an inanimate object in the fish tank."""
     emoji: str
     position: Tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class FishTank:
     """Represents the fish tank containing fish and inanimate objects."""
     width: int
@@ -93,32 +103,32 @@ class FishTank:
     top_border: str = "🌊"
     bottom_border: str = "🪨"
     side_border: str = "🪟"
+    _occupied: Set[Tuple[int, int]] = field(init=False, repr=False, compare=False)
+    _pool: Optional[ThreadPoolExecutor] = field(init=False, repr=False, compare=False)
+    _requests: Dict[Tuple[int, int], List[Fish]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Builds the occupied-position set so collision checks are O(1)."""
+        self._occupied = set()
+        self._pool = None
+        self._requests = {}
 
     def add_fish(self, fish: Fish) -> None:
         """Adds a fish to the tank."""
-        LOGGER.info(f"Adding fish {fish.name} at position {fish.position}")
+        LOGGER.info("Adding fish %s at position %s", fish.name, fish.position)
         self.fishes.append(fish)
+        self._occupied.add(fish.position)
 
     def add_object(self, obj: InanimateObject) -> None:
         """Adds an inanimate object to the tank."""
-        LOGGER.info(f"Adding object {obj.emoji} at position {obj.position}")
+        LOGGER.info("Adding object %s at position %s", obj.emoji, obj.position)
         self.objects.append(obj)
+        self._occupied.add(obj.position)
 
     def is_move_possible(self, position: Tuple[int, int]) -> bool:
         """Checks if a move is possible (within bounds and no collision with objects)."""
         x, y = position
-        if not (0 <= x < self.width and 0 <= y < self.height):
-            return False
-
-        for obj in self.objects:
-            if obj.position == position:
-                return False
-
-        for fish in self.fishes:
-            if fish.position == position:
-                return False
-
-        return True
+        return 0 <= x < self.width and 0 <= y < self.height and position not in self._occupied
 
     def get_object_at_position(self, position: Tuple[int, int]) -> Optional[str]:
         """Returns the emoji of the object at the given position, or None if there's no object."""
@@ -137,12 +147,14 @@ class FishTank:
     def remove_object_at_position(self, position: Tuple[int, int]) -> None:
         """Removes an object at the specified position."""
         self.objects = [obj for obj in self.objects if obj.position != position]
-        LOGGER.info(f"Object at position {position} has been removed from the tank.")
+        self._occupied.discard(position)
+        LOGGER.info("Object at position %s has been removed from the tank.", position)
 
     def remove_fish_at_position(self, position: Tuple[int, int]) -> None:
         """Removes a fish at the specified position."""
         self.fishes = [fish for fish in self.fishes if fish.position != position]
-        LOGGER.info(f"Fish at position {position} has been removed from the tank.")
+        self._occupied.discard(position)
+        LOGGER.info("Fish at position %s has been removed from the tank.", position)
 
     def get_mini_map(self, position: Tuple[int, int], view_range: int = 2) -> List[List[Optional[str]]]:
         """Generates a mini-map of the surrounding area based on the fish's position."""
@@ -169,16 +181,44 @@ class FishTank:
                 else:
                     row.append(None)  # Out of bounds
             mini_map.append(row)
-        LOGGER.info(f"Mini-map for fish at position {position} generated.")
         return mini_map
 
+    def resolve_moves(self) -> None:
+        """Resolves all proposed moves in one pass.
+
+        Each contested cell goes to one randomly chosen requester; the rest
+        stay put. Only fish that actually moved refresh their field of view.
+        """
+        for target, requesters in self._requests.items():
+            if not self.is_move_possible(target):
+                LOGGER.info("Move to %s blocked; %s fish stay put.", target, len(requesters))
+                continue
+            winner = random.choice(requesters)
+            LOGGER.info("Move successful. %s moved to %s", winner.name, target)
+            self._occupied.remove(winner.position)
+            self._occupied.add(target)
+            winner.position = target
+            winner.update_field_of_view()
+        self._requests.clear()
+
+    def update_all_fov(self) -> None:
+        """Refreshes every fish's field of view in parallel.
+
+        Each update is an independent read of the tank, so the calls are
+        submitted to a shared thread pool and joined before returning.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+        futures = [self._pool.submit(fish.update_field_of_view) for fish in self.fishes]
+        for future in futures:
+            future.result()
+
     def render_tank(self) -> None:
         """Renders the entire fish tank with borders and objects."""
         LOGGER.info("Rendering fish tank with borders.")
 
-        # Render the top border
-        print(self.top_border * (self.width + 2))
-
+        # Buffer the whole frame and write it in one go instead of a print per row.
+        lines = [self.top_border * (self.width + 2)]
         for y in range(self.height):
             row = [self.side_border]
             for x in range(self.width):
@@ -196,10 +236,9 @@ class FishTank:
                             break
                 row.append(emoji)
             row.append(self.side_border)
-            print("".join(row))
-
-        # Render the bottom border
-        print(self.bottom_border * (self.width + 2))
+            lines.append("".join(row))
+        lines.append(self.bottom_border * (self.width + 2))
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
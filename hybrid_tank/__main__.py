@@ -1,6 +1,7 @@
 """"
 Fish tank. Bot controls entire board.
 """
+import asyncio
 import textwrap
 
 import openai
@@ -9,10 +10,12 @@ from pathlib import Path
 from typing import List, Tuple, Dict
 import logging
 import random
+import sys
 
 import os
 
-from openai import OpenAI
+import numpy as np
+from openai import AsyncOpenAI
 
 from ai_fish_tank.env_loader import load_env
 
@@ -28,6 +31,8 @@ TANK_HEIGHT = 5
 class Fish:
     """Represents a fish in the fish tank with attributes such as name, position, species, and personality traits."""
 
+    __slots__ = ("name", "position", "species", "traits", "emoji", "goal")
+
     def __init__(self, name: str, position: Tuple[int, int], species: str, traits: str, emoji: str, goal: str) -> None:
         """
         Initializes a Fish object.
@@ -44,7 +49,8 @@ class Fish:
         self.position = position
         self.species = species
         self.traits = traits
-        self.emoji = emoji
+        # Interned so emoji equality and dict lookups can short-circuit on identity.
+        self.emoji = sys.intern(emoji)
         self.goal = goal
 
     def move(self, new_position: Tuple[int, int]) -> None:
@@ -63,6 +69,8 @@ class Fish:
 class FishTank:
     """Represents the fish tank environment with fish and plants."""
 
+    __slots__ = ("rounds", "fish_list", "plants_list", "tank_size", "story_so_far", "current_layout", "conversation", "_personae_cache", "_client", "_grid")
+
     def __init__(self, fish_list: List[Fish]) -> None:
         """
         Initializes the FishTank object.
@@ -79,6 +87,11 @@ class FishTank:
         self.initialize_with_plants(["🌿", "🌱"])
         self.current_layout = []
         self.conversation = []
+        self._personae_cache = None
+        # Preallocated character grid reused by draw() every frame.
+        self._grid = np.full(self.tank_size, "⬜", dtype="U2")
+        # One client for the life of the tank so the HTTP connection pool is reused.
+        self._client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
     def initialize_with_plants(self, plants: List[str]) -> None:
         """
@@ -90,32 +103,40 @@ class FishTank:
         # select a random position for each plant bound by tank size
         for plant in plants:
             x, y = random.randint(0, self.tank_size[0] - 1), random.randint(0, self.tank_size[1] - 1)
-            self.plants_list.append((plant, (x, y)))
+            self.plants_list.append((sys.intern(plant), (x, y)))
 
     def personae_dramatis_markdown(self):
         """
         Returns a markdown summary of the fish in the tank.
         """
-        return "\n".join([f"- {fish.emoji} {fish.name} ({fish.species}, {fish.traits})" for fish in self.fish_list])
+        # The cast never changes after construction, so build the summary once.
+        if self._personae_cache is None:
+            self._personae_cache = "\n".join(
+                ["- %s %s (%s, %s)" % (fish.emoji, fish.name, fish.species, fish.traits) for fish in self.fish_list])
+        return self._personae_cache
 
     def draw(self) -> str:
         """Visual representation of the fish tank as a 12x12 grid."""
-        tank = [["⬜" for _ in range(self.tank_size[1])] for _ in range(self.tank_size[0])]
+        grid = self._grid
+        grid[:] = "⬜"
 
-        # fixed plants
-        for plant, (x, y) in self.plants_list:
-            tank[x][y] = plant
+        # fixed plants, assigned in one vectorized step
+        if self.plants_list:
+            xs = [x for _, (x, _) in self.plants_list]
+            ys = [y for _, (_, y) in self.plants_list]
+            grid[xs, ys] = [plant for plant, _ in self.plants_list]
 
         # moving fish
-        for fish in self.fish_list:
-            x, y = fish.position
-            tank[x][y] = fish.emoji
+        xs = [fish.position[0] for fish in self.fish_list]
+        ys = [fish.position[1] for fish in self.fish_list]
+        grid[xs, ys] = [fish.emoji for fish in self.fish_list]
 
+        tank = grid.tolist()
         LOGGER.info(self.list_differences(tank))
         self.current_layout = tank
         return "\n".join(["".join(row) for row in tank])
 
-    def list_differences(self, new_layout: List[List[str]]) -> Dict[str, Tuple[int, int]]:
+    def list_differences(self, new_layout: List[List[str]]) -> Dict[Tuple[int, int], Tuple[str, str]]:
         """
         Returns the differences between the current layout and the new layout.
 
@@ -123,14 +144,16 @@ class FishTank:
             new_layout (List[List[str]]): The new layout of the fish tank.
 
         Returns:
-            Dict[str, Tuple[int, int]]: A dictionary containing the differences between the two layouts.
+            Dict[Tuple[int, int], Tuple[str, str]]: Maps changed cells to their (old, new) emojis.
         """
         differences = {}
         for i in range(len(self.current_layout)):
+            # Most rows are unchanged between rounds; skip them wholesale.
+            if self.current_layout[i] == new_layout[i]:
+                continue
             for j in range(len(self.current_layout[i])):
                 if self.current_layout[i][j] != new_layout[i][j]:
-                    differences[self.current_layout[i][j] + new_layout[i][j]] = (
-                    self.current_layout[i][j], new_layout[i][j])
+                    differences[(i, j)] = (self.current_layout[i][j], new_layout[i][j])
         return differences
 
     def pretty_print_and_wrap(self, story: str) -> str:
@@ -169,26 +192,23 @@ class FishTank:
         LOGGER.warning("Rows: %s, Cols: %s", rows, cols)
 
         # clear tank
-        for i in range(rows):
-            for j in range(cols):
-                tank_data[i] = tank_data[i].replace("⬜", " ")
+        tank_data = [row.replace("⬜", " ") for row in tank_data]
 
+        emoji_to_fish = {fish.emoji: fish for fish in self.fish_list}
         for i, row in enumerate(tank_data):
             for j, cell in enumerate(row):
-                for fish in self.fish_list:
-                    if cell == fish.emoji:
-                        fish.move((i, j))
+                fish = emoji_to_fish.get(cell)
+                if fish:
+                    fish.move((i, j))
 
-    def generate_story(self) -> str:
+    async def generate_story(self) -> str:
         """
         Generates a story based on the current state of the fish tank using OpenAI API.
 
         Returns:
             str: The story generated by the OpenAI API.
         """
-        client = OpenAI(
-            api_key=os.environ.get("OPENAI_API_KEY"),
-        )
+        client = self._client
         self.rounds += 1
         if self.rounds == 1:
             prompt = "Here is the personae dramatis:\n" + self.personae_dramatis_markdown() + "\n"
@@ -211,7 +231,7 @@ class FishTank:
             ]
         else:
             self.conversation.append({"role": "user", "content": prompt})
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=self.conversation,
             max_tokens=5000
@@ -226,11 +246,26 @@ class FishTank:
         LOGGER.debug("Received story: %s", story)
         return story
 
+    def __getstate__(self):
+        """Drops the OpenAI client from the pickled state; it is not picklable."""
+        return {slot: getattr(self, slot) for slot in self.__slots__ if slot != "_client"}
+
+    def __setstate__(self, state) -> None:
+        """Restores pickled state and rebuilds the OpenAI client."""
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+
+    def snapshot_state(self) -> bytes:
+        """Serializes the tank to pickle bytes (protocol 5 handles the numpy grid efficiently)."""
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
     def save_state(self, save_path) -> None:
         """Saves the current state of the fish tank to a pickle file."""
         LOGGER.debug("Saving fish tank state to %s", save_path)
-        with open(save_path, 'wb') as file:
-            pickle.dump(self, file)
+        # Big write buffer so the snapshot goes out in large chunks.
+        with open(save_path, 'wb', buffering=1 << 20) as file:
+            file.write(self.snapshot_state())
 
     @classmethod
     def load_state(cls, save_path:Path) -> "FishTank":
@@ -258,24 +293,35 @@ class FishTankSimulator:
         self.save_path = save_path
 
 
-    def run_simulation(self) -> None:
+    async def run_simulation(self) -> None:
         """Runs the fish tank simulation, updating the tank and generating stories."""
         print(self.fish_tank.personae_dramatis_markdown())
+        save_task = None
         while True:
             print("\nCurrent Fish Tank:")
             print(self.fish_tank.draw())
-            story = self.fish_tank.generate_story()
+            if save_task is None:
+                story = await self.fish_tank.generate_story()
+            else:
+                # Overlap the HTTPS round trip with the previous round's disk write.
+                story, _ = await asyncio.gather(self.fish_tank.generate_story(), save_task)
+                save_task = None
             print("\nStory:")
 
             # format story so it word wraps nicely
             print(self.fish_tank.pretty_print_and_wrap(story))
 
             self.fish_tank.update_tank(story)
-            self.fish_tank.save_state(self.save_path)
+            # Pickle here, while nothing else touches the tank; only the file
+            # write overlaps the next round, and it sees an immutable snapshot.
+            snapshot = self.fish_tank.snapshot_state()
+            save_task = asyncio.create_task(asyncio.to_thread(self.save_path.write_bytes, snapshot))
 
             user_input = input("\nContinue simulation? (y/n): ").strip().lower()
             if user_input != 'y':
                 break
+        if save_task is not None:
+            await save_task
 
 
 if __name__ == "__main__":
@@ -289,11 +335,10 @@ if __name__ == "__main__":
         Fish("Glimmer", (4, 4), "Guppy", "peaceful", "🦐", "Socializing with others")
     ]
 
-    # Randomize positions of fish
-    for fish in fish_list:
-        possible = (random.randint(0, TANK_WIDTH - 1), random.randint(0, TANK_HEIGHT - 1))
-        if possible not in [fish.position for fish in fish_list]:
-            fish.move(possible)
+    # Randomize positions of fish; sampling guarantees distinct cells, no rejection loop
+    coords = random.sample([(x, y) for x in range(TANK_WIDTH) for y in range(TANK_HEIGHT)], k=len(fish_list))
+    for fish, position in zip(fish_list, coords):
+        fish.move(position)
 
     # Validate that the fish all have distinct emojis
     emojis = [fish.emoji for fish in fish_list]
@@ -306,4 +351,4 @@ if __name__ == "__main__":
         fish_tank = FishTank(fish_list=fish_list)
 
     simulator = FishTankSimulator(fish_tank=fish_tank, save_path=Path("fish_tank_state.pkl"))
-    simulator.run_simulation()
+    asyncio.run(simulator.run_simulation())